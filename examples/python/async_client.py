@@ -0,0 +1,154 @@
+"""Async Memorose client for high-fanout ingest workloads.
+
+Mirrors the core surface of MemoroseClient (http_client.py) on top of
+aiohttp, so one thread can drive many in-flight requests against the
+server instead of blocking per call.
+
+Setup:
+    pip install aiohttp
+"""
+
+import asyncio
+import random
+import uuid
+from typing import Any, Dict, List, Optional
+
+import aiohttp
+
+try:  # imported as a package (e.g. examples.python.async_client)
+    from .common import BACKOFF_BASE, BACKOFF_CAP, MemoroseError, _dumps, _loads
+except ImportError:  # run as a script from examples/python
+    from common import BACKOFF_BASE, BACKOFF_CAP, MemoroseError, _dumps, _loads
+
+
+class AsyncMemoroseClient:
+    """Async client for the Memorose v1 REST API.
+
+    Use as an async context manager so the underlying aiohttp session
+    (and its keep-alive connection pool) is created and torn down cleanly:
+
+        async with AsyncMemoroseClient(user_id="u1") as client:
+            await asyncio.gather(*[client.ingest_event(c) for c in contents])
+    """
+
+    def __init__(
+        self,
+        base_url: str = "http://localhost:3000",
+        user_id: str = "demo-user",
+        stream_id: Optional[str] = None,
+        org_id: Optional[str] = None,
+        api_key: Optional[str] = None,
+        token: Optional[str] = None,
+        timeout: float = 30,
+        max_retries: int = 2,
+    ) -> None:
+        self.base_url = base_url.rstrip("/")
+        self.user_id = user_id
+        self.stream_id = stream_id or str(uuid.uuid4())
+        self.org_id = org_id
+        self.api_key = api_key
+        self.token = token
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self._rng = random.Random()
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    async def __aenter__(self) -> "AsyncMemoroseClient":
+        headers = {"Content-Type": "application/json"}
+        if self.api_key:
+            headers["x-api-key"] = self.api_key
+        elif self.token:
+            headers["Authorization"] = f"Bearer {self.token}"
+        self._session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=64, keepalive_timeout=30),
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+            headers=headers,
+        )
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def _backoff(self, attempt: int) -> None:
+        """Same full-jitter policy as the sync client, on the event loop."""
+        await asyncio.sleep(self._rng.uniform(0, min(BACKOFF_CAP, BACKOFF_BASE * 2**attempt)))
+
+    async def _request(self, method: str, path: str, **kwargs: Any) -> Any:
+        if self._session is None:
+            raise MemoroseError("Client not started; use 'async with AsyncMemoroseClient(...)'")
+        last_exc: Optional[Exception] = None
+        for attempt in range(self.max_retries + 1):
+            try:
+                async with self._session.request(method, f"{self.base_url}{path}", **kwargs) as resp:
+                    body = await resp.read()
+                    if resp.status == 503 and attempt < self.max_retries:
+                        await self._backoff(attempt)
+                        continue
+                    if resp.status >= 400:
+                        try:
+                            parsed = _loads(body)
+                        except Exception:
+                            parsed = body.decode(errors="replace")
+                        raise MemoroseError(f"HTTP {resp.status}: {resp.reason}", status_code=resp.status, body=parsed)
+                    # Mirror the sync client: empty bodies yield None, and a
+                    # non-JSON success body falls back to text.
+                    if not body:
+                        return None
+                    try:
+                        return _loads(body)
+                    except Exception:
+                        return body.decode(errors="replace")
+            except aiohttp.ClientConnectionError as exc:
+                last_exc = exc
+                if attempt < self.max_retries:
+                    await self._backoff(attempt)
+                    continue
+                raise MemoroseError(f"Connection failed: {exc}") from exc
+        raise MemoroseError(f"Request failed after {self.max_retries + 1} attempts") from last_exc
+
+    # ── Ingest ────────────────────────────────────────────────────────────
+
+    async def ingest_event(self, content: str, content_type: str = "text", *, org_id: Optional[str] = None, stream_id: Optional[str] = None) -> Dict[str, Any]:
+        """Ingest a single event."""
+        payload: Dict[str, Any] = {"content": content, "content_type": content_type}
+        if org_id or self.org_id:
+            payload["org_id"] = org_id or self.org_id
+        sid = stream_id or self.stream_id
+        return await self._request("POST", f"/v1/users/{self.user_id}/streams/{sid}/events", data=_dumps(payload))
+
+    async def ingest_batch(self, events: List[Dict[str, Any]], *, stream_id: Optional[str] = None) -> Dict[str, Any]:
+        """Ingest multiple events in one request."""
+        sid = stream_id or self.stream_id
+        return await self._request("POST", f"/v1/users/{self.user_id}/streams/{sid}/events/batch", data=_dumps({"events": events}))
+
+    # ── Retrieve ──────────────────────────────────────────────────────────
+
+    async def retrieve_memory(self, query: str, *, limit: int = 10, org_id: Optional[str] = None, stream_id: Optional[str] = None) -> Dict[str, Any]:
+        """Hybrid search over the user's memory store."""
+        payload: Dict[str, Any] = {"query": query, "limit": limit}
+        if org_id or self.org_id:
+            payload["org_id"] = org_id or self.org_id
+        sid = stream_id or self.stream_id
+        return await self._request("POST", f"/v1/users/{self.user_id}/streams/{sid}/retrieve", data=_dumps(payload))
+
+
+async def main_async() -> None:
+    print("\n" + "=" * 20 + " Memorose Async Client " + "=" * 20)
+    conversations = [
+        "I used to live in Shanghai.",
+        "My email is old@example.com.",
+        "I prefer Rust over Python.",
+    ]
+    async with AsyncMemoroseClient(user_id="demo-python-user", stream_id="demo-session") as client:
+        print("\n--- 1. Concurrent Ingest ---")
+        for result in await asyncio.gather(*[client.ingest_event(c) for c in conversations]):
+            print(result)
+
+        print("\n--- 2. Retrieving Memory ---")
+        print(await client.retrieve_memory("Where do I live now?"))
+
+
+if __name__ == "__main__":
+    asyncio.run(main_async())
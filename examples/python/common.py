@@ -0,0 +1,105 @@
+"""Shared helpers for the Memorose Python examples.
+
+Everything here is HTTP-library agnostic (sessions are passed in, never
+created), so the requests-based test scripts can import it without
+pulling in httpx or the SDK's DNS cache from http_client.py.
+"""
+
+import os
+import time
+import uuid
+from typing import Any, Dict, Optional
+
+try:  # orjson is a C codec, ~2-5x faster than stdlib json on both directions
+    import orjson
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+    def _loads(data: bytes) -> Any:
+        return orjson.loads(data)
+
+except ImportError:
+    import json
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
+    def _loads(data: bytes) -> Any:
+        return json.loads(data)
+
+
+try:  # optional request compression for large media payloads
+    import zstandard as zstd
+except ImportError:
+    zstd = None
+
+# Bodies at or below this size aren't worth the compression round-trip.
+COMPRESS_MIN_BYTES = 4096
+
+# Full-jitter exponential backoff bounds shared by the sync/async clients.
+BACKOFF_BASE = 0.05
+BACKOFF_CAP = 2.0
+
+
+class MemoroseError(Exception):
+    """Base exception for Memorose client errors."""
+
+    def __init__(self, message: str, status_code: Optional[int] = None, body: Any = None) -> None:
+        super().__init__(message)
+        self.status_code = status_code
+        self.body = body
+
+
+def _maybe_compress(body: bytes) -> "tuple[bytes, Optional[Dict[str, str]]]":
+    """zstd-compress request bodies over 4KB (opt-in via MEMOROSE_ZSTD=1).
+
+    Base64 media compresses 3-10x, but the server must accept
+    Content-Encoding: zstd, hence the opt-in. Returns (body, headers).
+    """
+    if zstd is None or os.environ.get("MEMOROSE_ZSTD") != "1" or len(body) <= COMPRESS_MIN_BYTES:
+        return body, None
+    return zstd.ZstdCompressor(level=3).compress(body), {"Content-Encoding": "zstd"}
+
+
+def _persistent_stream_id(scope: str) -> str:
+    """Return a stream id, reused across runs when MEMOROSE_PERSIST_STREAM=1.
+
+    A fresh uuid4 per process defeats server-side per-stream caches
+    (embeddings, warm index state), so repeated benchmark runs always hit
+    the cold path. Opt-in only, to keep default test semantics unchanged.
+    """
+    if os.environ.get("MEMOROSE_PERSIST_STREAM") != "1":
+        return str(uuid.uuid4())
+    path = os.path.expanduser(f"~/.memorose/stream_id.{scope}")
+    try:
+        if os.path.exists(path):
+            with open(path) as f:
+                sid = f.read().strip()
+            if sid:
+                return sid
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        sid = str(uuid.uuid4())
+        with open(path, "w") as f:
+            f.write(sid)
+        return sid
+    except OSError:
+        return str(uuid.uuid4())
+
+
+def poll_results(session: Any, url: str, query: str, *, headers: Optional[Dict[str, str]] = None, attempts: int = 50, delay: float = 0.1) -> "tuple[Any, list]":
+    """Poll retrieve until consolidation surfaces results, instead of a fixed sleep.
+
+    Worst case matches a hard wait of attempts * delay (5s by default), but
+    the common case returns as soon as the worker has committed the memory.
+    """
+    payload = _dumps({"query": query})
+    resp = None
+    for _ in range(attempts):
+        resp = session.post(url, data=payload, headers=headers)
+        if resp.status_code == 200:
+            results = _loads(resp.content).get("results", [])
+            if results:
+                return resp, results
+        time.sleep(delay)
+    return resp, []
@@ -1,19 +1,72 @@
-"""Memorose Python SDK — reference client for the Memorose v1 REST API."""
-
-import time
-import uuid
-from typing import Any, Dict, List, Literal, Optional, Union
-
-import requests
+"""Memorose Python SDK — reference client for the Memorose v1 REST API.
 
+Setup:
+    pip install 'httpx[http2]'
+"""
 
-class MemoroseError(Exception):
-    """Base exception for Memorose client errors."""
-
-    def __init__(self, message: str, status_code: Optional[int] = None, body: Any = None) -> None:
-        super().__init__(message)
-        self.status_code = status_code
-        self.body = body
+import random
+import socket
+import time
+from collections import deque
+from typing import Any, Dict, Iterable, Iterator, List, Literal, Optional, Union
+
+import httpx
+
+try:  # imported as a package (e.g. examples.python.http_client)
+    from .common import (
+        BACKOFF_BASE,
+        BACKOFF_CAP,
+        COMPRESS_MIN_BYTES,
+        MemoroseError,
+        _dumps,
+        _loads,
+        _persistent_stream_id,
+        zstd,
+    )
+except ImportError:  # run as a script from examples/python
+    from common import (
+        BACKOFF_BASE,
+        BACKOFF_CAP,
+        COMPRESS_MIN_BYTES,
+        MemoroseError,
+        _dumps,
+        _loads,
+        _persistent_stream_id,
+        zstd,
+    )
+
+
+# In-process DNS cache: every new pooled connection otherwise triggers a
+# blocking, uncached getaddrinfo(). The server host set is tiny and stable,
+# so a short TTL is safe.
+_DNS_TTL = 5.0
+_DNS_MAX_ENTRIES = 64
+_dns_cache: Dict[tuple, "tuple[float, Any]"] = {}
+_real_getaddrinfo = socket.getaddrinfo
+
+
+def _cached_getaddrinfo(host: Any, port: Any, family: int = 0, type: int = 0, proto: int = 0, flags: int = 0) -> Any:
+    key = (host, port, family, type, proto, flags)
+    now = time.monotonic()
+    hit = _dns_cache.get(key)
+    if hit is not None and now < hit[0]:
+        return hit[1]
+    result = _real_getaddrinfo(host, port, family, type, proto, flags)
+    if len(_dns_cache) >= _DNS_MAX_ENTRIES:
+        _dns_cache.clear()
+    _dns_cache[key] = (now + _DNS_TTL, result)
+    return result
+
+
+if socket.getaddrinfo is not _cached_getaddrinfo:  # idempotent across re-imports
+    socket.getaddrinfo = _cached_getaddrinfo
+
+
+# Circuit breaker: trip after this many consecutive failures, stay open for
+# a cool-down that doubles on each re-trip.
+BREAKER_THRESHOLD = 3
+BREAKER_COOLDOWN = 1.0
+BREAKER_MAX_COOLDOWN = 30.0
 
 
 class MemoroseClient:
@@ -33,50 +86,175 @@ class MemoroseClient:
         agent_id: Optional[str] = None,
         api_key: Optional[str] = None,
         token: Optional[str] = None,
-        timeout: float = 30,
+        timeout: Union[float, "tuple[float, float]"] = (1.0, 5.0),
         max_retries: int = 2,
+        debug: bool = False,
+        compress_requests: bool = False,
     ) -> None:
         self.base_url = base_url.rstrip("/")
         self.user_id = user_id
-        self.stream_id = stream_id or str(uuid.uuid4())
+        self.stream_id = stream_id or _persistent_stream_id(user_id)
+        # Hot-path URLs for the default stream, formatted once.
+        self._events_path = f"/v1/users/{self.user_id}/streams/{self.stream_id}/events"
+        self._retrieve_path = f"/v1/users/{self.user_id}/streams/{self.stream_id}/retrieve"
         self.org_id = org_id
         self.agent_id = agent_id
         self.api_key = api_key
         self.token = token
-        self.timeout = timeout
+        # A (connect, read) tuple bounds each phase so a stalled node fails
+        # fast into the retry/breaker path; a bare float caps the whole call.
+        if isinstance(timeout, tuple):
+            connect, read = timeout
+            self.timeout = httpx.Timeout(connect=connect, read=read, write=read, pool=connect)
+        else:
+            self.timeout = httpx.Timeout(timeout)
         self.max_retries = max_retries
-
-    def _headers(self) -> Dict[str, str]:
-        headers: Dict[str, str] = {"Content-Type": "application/json"}
+        self.debug = debug
+        # Opt-in: zstd-compress large request bodies (base64 media compresses
+        # 3-10x). Requires a server that accepts Content-Encoding: zstd.
+        self._zstd = zstd.ZstdCompressor(level=3) if compress_requests and zstd is not None else None
+        # Round-trip latency samples per (method, path); deque bounds memory.
+        self._stats: Dict["tuple[str, str]", Dict[str, Any]] = {}
+        # Swappable for a seeded random.Random in tests.
+        self._rng = random.Random()
+        # Circuit breaker state, keyed by endpoint URL so the same logic
+        # carries over to a multi-node client unchanged.
+        self._breaker: Dict[str, Dict[str, float]] = {}
+        # One long-lived client with a keep-alive pool. HTTP/2 multiplexes
+        # concurrent requests over a single connection instead of opening one
+        # socket per in-flight call.
+        self.session = httpx.Client(
+            http2=True,
+            limits=httpx.Limits(max_connections=16, max_keepalive_connections=16),
+        )
+        # Static headers live on the client; per-call headers passed through
+        # kwargs are merged on top by httpx.
+        self.session.headers["Content-Type"] = "application/json"
         if self.api_key:
-            headers["x-api-key"] = self.api_key
+            self.session.headers["x-api-key"] = self.api_key
         elif self.token:
-            headers["Authorization"] = f"Bearer {self.token}"
-        return headers
-
-    def _request(self, method: str, path: str, **kwargs: Any) -> requests.Response:
-        headers = self._headers()
-        if "headers" in kwargs:
-            headers.update(kwargs.pop("headers"))
-        kwargs["headers"] = headers
+            self.session.headers["Authorization"] = f"Bearer {self.token}"
+        self._warmup()
+
+    def _warmup(self) -> None:
+        """Prime the connection pool so the first real call skips the handshake.
+
+        Best-effort: any response (even an error) leaves a warm keep-alive
+        socket behind, and an unreachable server is simply ignored — the
+        breaker and retry logic handle it on the first real request.
+        """
+        try:
+            self.session.head(f"{self.base_url}/v1/status/pending", timeout=0.5)
+        except Exception:
+            pass
+
+    def close(self) -> None:
+        """Release the pooled connections held by the session."""
+        self.session.close()
+
+    def __enter__(self) -> "MemoroseClient":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def _backoff(self, attempt: int) -> None:
+        """Sleep with full jitter so synchronized clients don't retry in lockstep."""
+        time.sleep(self._rng.uniform(0, min(BACKOFF_CAP, BACKOFF_BASE * 2**attempt)))
+
+    # ── Latency tracking ──────────────────────────────────────────────────
+
+    def _record_latency(self, method: str, path: str, attempt: int, dt: float) -> None:
+        entry = self._stats.setdefault((method, path), {"count": 0, "samples": deque(maxlen=512)})
+        entry["count"] += 1
+        entry["samples"].append(dt)
+        if self.debug:
+            print(f"{method} {path} [attempt={attempt}] {dt * 1000:.1f}ms")
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """Aggregated round-trip latency per endpoint, in milliseconds."""
+        out: Dict[str, Dict[str, float]] = {}
+        for (method, path), entry in self._stats.items():
+            samples = sorted(entry["samples"])
+            n = len(samples)
+            out[f"{method} {path}"] = {
+                "count": entry["count"],
+                "min_ms": samples[0] * 1000,
+                "p50_ms": samples[n // 2] * 1000,
+                "p95_ms": samples[min(n - 1, int(n * 0.95))] * 1000,
+                "max_ms": samples[-1] * 1000,
+            }
+        return out
+
+    # ── Circuit breaker ───────────────────────────────────────────────────
+
+    def _breaker_state(self, url: str) -> Dict[str, float]:
+        return self._breaker.setdefault(url, {"failures": 0, "open_until": 0.0, "cooldown": BREAKER_COOLDOWN})
+
+    def _breaker_check(self, url: str) -> None:
+        """Fail fast while the breaker is open; past open_until one half-open probe is allowed."""
+        state = self._breaker_state(url)
+        if time.time() < state["open_until"]:
+            raise MemoroseError(f"Circuit breaker open for {url} (retry after {state['open_until'] - time.time():.1f}s)")
+
+    def _breaker_failure(self, url: str) -> None:
+        state = self._breaker_state(url)
+        state["failures"] += 1
+        if state["failures"] >= BREAKER_THRESHOLD:
+            state["open_until"] = time.time() + state["cooldown"]
+            state["cooldown"] = min(state["cooldown"] * 2, BREAKER_MAX_COOLDOWN)
+
+    def _breaker_success(self, url: str) -> None:
+        state = self._breaker_state(url)
+        state["failures"] = 0
+        state["open_until"] = 0.0
+        state["cooldown"] = BREAKER_COOLDOWN
+
+    def _request(self, method: str, path: str, **kwargs: Any) -> Any:
+        """Issue a request and return the parsed response body.
+
+        Parsing happens exactly once, here; callers receive the decoded
+        JSON (or raw text for non-JSON bodies) rather than re-parsing.
+        """
+        # Build the URL once; the endpoint doesn't change across retries.
+        url = self.base_url + path
+        body = kwargs.get("content")
+        if self._zstd is not None and isinstance(body, (bytes, bytearray)) and len(body) > COMPRESS_MIN_BYTES:
+            kwargs["content"] = self._zstd.compress(bytes(body))
+            kwargs.setdefault("headers", {})["Content-Encoding"] = "zstd"
         last_exc: Optional[Exception] = None
         for attempt in range(self.max_retries + 1):
+            self._breaker_check(self.base_url)
             try:
-                resp = requests.request(method, f"{self.base_url}{path}", timeout=self.timeout, **kwargs)
+                t0 = time.perf_counter()
+                resp = self.session.request(method, url, timeout=self.timeout, **kwargs)
+                self._record_latency(method, path, attempt, time.perf_counter() - t0)
                 if resp.status_code == 503 and attempt < self.max_retries:
-                    time.sleep(0.2 * (attempt + 1))
+                    self._breaker_failure(self.base_url)
+                    self._backoff(attempt)
                     continue
                 if resp.status_code >= 400:
+                    if resp.status_code >= 500:
+                        self._breaker_failure(self.base_url)
                     try:
-                        body = resp.json()
+                        body = _loads(resp.content)
                     except Exception:
                         body = resp.text
-                    raise MemoroseError(f"HTTP {resp.status_code}: {resp.reason}", status_code=resp.status_code, body=body)
-                return resp
-            except requests.ConnectionError as exc:
+                    raise MemoroseError(f"HTTP {resp.status_code}: {resp.reason_phrase}", status_code=resp.status_code, body=body)
+                self._breaker_success(self.base_url)
+                if not resp.content:
+                    return None
+                try:
+                    return _loads(resp.content)
+                except Exception:
+                    return resp.text
+            except httpx.TransportError as exc:
+                # Includes httpx.TimeoutException: a stalled read counts as a
+                # node failure for the breaker, same as a refused connection.
                 last_exc = exc
+                self._breaker_failure(self.base_url)
                 if attempt < self.max_retries:
-                    time.sleep(0.2 * (attempt + 1))
+                    self._backoff(attempt)
                     continue
                 raise MemoroseError(f"Connection failed: {exc}") from exc
         raise MemoroseError(f"Request failed after {self.max_retries + 1} attempts") from last_exc
@@ -89,13 +267,17 @@ class MemoroseClient:
         payload: Dict[str, Any] = {"content": content, "content_type": content_type}
         if org_id or self.org_id:
             payload["org_id"] = org_id or self.org_id
-        sid = stream_id or self.stream_id
-        return self._request("POST", f"/v1/users/{self.user_id}/streams/{sid}/events", json=payload).json()
+        path = f"/v1/users/{self.user_id}/streams/{stream_id}/events" if stream_id else self._events_path
+        return self._request("POST", path, content=_dumps(payload))
 
     def ingest_batch(self, events: List[Dict[str, Any]], *, stream_id: Optional[str] = None) -> Dict[str, Any]:
         """Ingest multiple events in one request."""
-        sid = stream_id or self.stream_id
-        return self._request("POST", f"/v1/users/{self.user_id}/streams/{sid}/events/batch", json={"events": events}).json()
+        path = f"/v1/users/{self.user_id}/streams/{stream_id}/events/batch" if stream_id else self._events_path + "/batch"
+        return self._request("POST", path, content=_dumps({"events": events}))
+
+    def ingest_events(self, contents: Iterable[str], *, stream_id: Optional[str] = None) -> Dict[str, Any]:
+        """Ingest a list of plain-text contents as one batch request."""
+        return self.ingest_batch([{"content": c} for c in contents], stream_id=stream_id)
 
     def ingest_image(self, image_data: str, **kw: Any) -> Dict[str, Any]:
         """Ingest a base64-encoded image."""
@@ -127,12 +309,40 @@ class MemoroseClient:
         for k, v in [("start_time", start_time), ("end_time", end_time), ("as_of", as_of), ("image", image), ("audio", audio), ("video", video)]:
             if v:
                 payload[k] = v
-        sid = stream_id or self.stream_id
-        return self._request("POST", f"/v1/users/{self.user_id}/streams/{sid}/retrieve", json=payload).json()
+        path = f"/v1/users/{self.user_id}/streams/{stream_id}/retrieve" if stream_id else self._retrieve_path
+        return self._request("POST", path, content=_dumps(payload))
+
+    def retrieve_memory_stream(self, query: str, *, limit: int = 10, org_id: Optional[str] = None, stream_id: Optional[str] = None) -> Iterator[Any]:
+        """Stream retrieve results one at a time as NDJSON.
+
+        Sends Accept: application/x-ndjson and yields each result line as it
+        arrives, so time-to-first-result and memory footprint stay O(1)
+        instead of buffering the full response. Requires a server that
+        supports NDJSON on the retrieve endpoint; use retrieve_memory for
+        the buffered JSON form.
+        """
+        payload: Dict[str, Any] = {"query": query, "limit": limit}
+        if org_id or self.org_id:
+            payload["org_id"] = org_id or self.org_id
+        path = f"/v1/users/{self.user_id}/streams/{stream_id}/retrieve" if stream_id else self._retrieve_path
+        url = self.base_url + path
+        with self.session.stream("POST", url, content=_dumps(payload), headers={"Accept": "application/x-ndjson"}, timeout=self.timeout) as resp:
+            if resp.status_code >= 400:
+                resp.read()
+                raise MemoroseError(f"HTTP {resp.status_code}: {resp.reason_phrase}", status_code=resp.status_code, body=resp.text)
+            content_type = resp.headers.get("content-type", "")
+            if "application/x-ndjson" not in content_type:
+                # A server without NDJSON support replies with the buffered
+                # JSON object; yielding that would break the one-item-per-
+                # line contract, so fail loudly instead.
+                raise MemoroseError(f"Server does not support NDJSON streaming (got Content-Type {content_type or 'none'}); use retrieve_memory instead")
+            for line in resp.iter_lines():
+                if line:
+                    yield _loads(line)
 
     def get_memory(self, memory_id: str) -> Dict[str, Any]:
         """Get a single memory unit by ID."""
-        return self._request("GET", f"/v1/users/{self.user_id}/memories/{memory_id}").json()
+        return self._request("GET", f"/v1/users/{self.user_id}/memories/{memory_id}")
 
     # ── Context (sidecar) ─────────────────────────────────────────────────
 
@@ -146,7 +356,7 @@ class MemoroseClient:
         for k, v in [("min_score", min_score), ("graph_depth", graph_depth), ("image", image), ("audio", audio), ("video", video)]:
             if v is not None:
                 payload[k] = v
-        return self._request("POST", "/v1/memory/context", json=payload).json()
+        return self._request("POST", "/v1/memory/context", content=_dumps(payload))
     # APPEND_MARKER_3
 
     # ── Semantic corrections ──────────────────────────────────────────────
@@ -156,7 +366,7 @@ class MemoroseClient:
         payload: Dict[str, Any] = {"instruction": instruction, "mode": mode, "forget_mode": forget_mode, "limit": limit}
         if self.org_id:
             payload["org_id"] = self.org_id
-        return self._request("POST", f"/v1/users/{self.user_id}/memories/semantic/preview", json=payload).json()
+        return self._request("POST", f"/v1/users/{self.user_id}/memories/semantic/preview", content=_dumps(payload))
 
     def semantic_execute(self, plan_id: str, *, reviewer: Optional[str] = None, note: Optional[str] = None) -> Dict[str, Any]:
         """Execute a previously previewed semantic plan."""
@@ -167,7 +377,7 @@ class MemoroseClient:
             payload["reviewer"] = reviewer
         if note:
             payload["note"] = note
-        return self._request("POST", f"/v1/users/{self.user_id}/memories/semantic/execute", json=payload).json()
+        return self._request("POST", f"/v1/users/{self.user_id}/memories/semantic/execute", content=_dumps(payload))
 
     def semantic_update(self, instruction: str, *, reviewer: Optional[str] = None, note: Optional[str] = None) -> Dict[str, Any]:
         """Preview + execute a semantic update in one call."""
@@ -184,11 +394,11 @@ class MemoroseClient:
     def get_task_trees(self, *, stream_id: Optional[str] = None) -> Dict[str, Any]:
         """Get all goal/task trees for the user."""
         path = f"/v1/users/{self.user_id}/streams/{stream_id}/tasks/tree" if stream_id else f"/v1/users/{self.user_id}/tasks/tree"
-        return self._request("GET", path).json()
+        return self._request("GET", path)
 
     def get_ready_tasks(self) -> Dict[str, Any]:
         """Get tasks that are ready to execute."""
-        return self._request("GET", f"/v1/users/{self.user_id}/tasks/ready").json()
+        return self._request("GET", f"/v1/users/{self.user_id}/tasks/ready")
 
     def update_task_status(self, task_id: str, status: str, *, progress: Optional[float] = None, result_summary: Optional[str] = None) -> Dict[str, Any]:
         """Update a task's status."""
@@ -197,7 +407,7 @@ class MemoroseClient:
             payload["progress"] = progress
         if result_summary is not None:
             payload["result_summary"] = result_summary
-        return self._request("PUT", f"/v1/users/{self.user_id}/tasks/{task_id}/status", json=payload).json()
+        return self._request("PUT", f"/v1/users/{self.user_id}/tasks/{task_id}/status", content=_dumps(payload))
 
     # ── Graph ─────────────────────────────────────────────────────────────
 
@@ -206,7 +416,7 @@ class MemoroseClient:
         payload: Dict[str, Any] = {"source_id": source_id, "target_id": target_id, "relation": relation}
         if weight is not None:
             payload["weight"] = weight
-        return self._request("POST", f"/v1/users/{self.user_id}/graph/edges", json=payload).json()
+        return self._request("POST", f"/v1/users/{self.user_id}/graph/edges", content=_dumps(payload))
 
     # ── Organization knowledge ────────────────────────────────────────────
 
@@ -215,27 +425,27 @@ class MemoroseClient:
         oid = org_id or self.org_id
         if not oid:
             raise MemoroseError("org_id is required")
-        return self._request("GET", f"/v1/organizations/{oid}/knowledge").json()
+        return self._request("GET", f"/v1/organizations/{oid}/knowledge")
 
     def get_org_knowledge(self, knowledge_id: str, org_id: Optional[str] = None) -> Dict[str, Any]:
         """Get a single organization knowledge entry."""
         oid = org_id or self.org_id
         if not oid:
             raise MemoroseError("org_id is required")
-        return self._request("GET", f"/v1/organizations/{oid}/knowledge/{knowledge_id}").json()
+        return self._request("GET", f"/v1/organizations/{oid}/knowledge/{knowledge_id}")
 
     def get_org_knowledge_metrics(self, org_id: Optional[str] = None) -> Dict[str, Any]:
         """Get organization knowledge automation metrics."""
         oid = org_id or self.org_id
         if not oid:
             raise MemoroseError("org_id is required")
-        return self._request("GET", f"/v1/organizations/{oid}/knowledge/metrics").json()
+        return self._request("GET", f"/v1/organizations/{oid}/knowledge/metrics")
 
     # ── Status ────────────────────────────────────────────────────────────
 
     def pending_count(self) -> Dict[str, Any]:
         """Get the number of pending events in the pipeline."""
-        return self._request("GET", "/v1/status/pending").json()
+        return self._request("GET", "/v1/status/pending")
 
     # ── Dashboard ─────────────────────────────────────────────────────────
 
@@ -244,7 +454,7 @@ class MemoroseClient:
         query = f"?user_id={self.user_id}&status=pending&limit={limit}"
         if self.org_id:
             query += f"&org_id={self.org_id}"
-        return self._request("GET", f"/v1/dashboard/corrections/reviews{query}").json()
+        return self._request("GET", f"/v1/dashboard/corrections/reviews{query}")
 
 
 def main() -> None:
@@ -252,9 +462,10 @@ def main() -> None:
     client = MemoroseClient(base_url="http://localhost:3000", user_id="demo-python-user", stream_id="demo-session")
 
     print("\n--- 1. Ingesting Events ---")
-    for line in ["I used to live in Shanghai.", "My email is old@example.com.", "I prefer Rust over Python."]:
-        print(client.ingest_event(line))
-        time.sleep(0.1)
+    lines = ("I used to live in Shanghai.", "My email is old@example.com.", "I prefer Rust over Python.")
+    # One batch POST amortizes request framing and the server-side commit
+    # across all events.
+    print(client.ingest_events(lines))
 
     print("\n--- 2. Batch Ingest ---")
     print(client.ingest_batch([{"content": "I have a cat named Mochi."}, {"content": "My favorite color is blue."}]))
@@ -277,6 +488,10 @@ def main() -> None:
     print("\n--- 7. Pending Count ---")
     print(client.pending_count())
 
+    print("\n--- 8. Client Latency Stats ---")
+    for endpoint, s in client.stats().items():
+        print(f"  {endpoint}: n={s['count']} p50={s['p50_ms']:.1f}ms p95={s['p95_ms']:.1f}ms max={s['max_ms']:.1f}ms")
+
 
 if __name__ == "__main__":
     main()
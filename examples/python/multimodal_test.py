@@ -1,53 +1,59 @@
 import requests
-import uuid
-import time
 import base64
-import os
+
+try:  # imported as a package (e.g. examples.python.multimodal_test)
+    from .common import _dumps, _maybe_compress, _persistent_stream_id, poll_results
+except ImportError:  # run as a script from examples/python
+    from common import _dumps, _maybe_compress, _persistent_stream_id, poll_results
 
 # Configuration
 BASE_URL = "http://localhost:3000"
 TENANT_ID = "multimodal-test-tenant"
-STREAM_ID = str(uuid.uuid4())
+STREAM_ID = _persistent_stream_id(TENANT_ID)
+
+# Shared keep-alive session so ingest + retrieve reuse one TCP connection.
+SESSION = requests.Session()
+SESSION.headers["Content-Type"] = "application/json"
 
 # 1. Create a dummy image (1x1 red pixel)
 # Base64 of a 1x1 red PNG
 RED_PIXEL_B64 = "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mP8z8BQDwAEhQGAhKmMIQAAAABJRU5ErkJggg=="
 
+# Decoded once at import so loops/retries never re-pay the base64 decode.
+# The ingest API only accepts base64 inside JSON (gemini.rs treats non-http
+# content as base64 data), so the wire payload stays RED_PIXEL_B64.
+RED_PIXEL_BYTES = base64.b64decode(RED_PIXEL_B64)
+
+
 def test_multimodal_ingest():
     print(f"Stream ID: {STREAM_ID}")
-    
+
     # 2. Ingest Image Event
-    # Note: Memorose expects "content" to be URL or Data. 
-    # Since we don't have a public URL for this test, we pass base64 directly as content 
+    # Note: Memorose expects "content" to be URL or Data.
+    # Since we don't have a public URL for this test, we pass base64 directly as content
     # and rely on the updated gemini.rs to handle it (it treats non-http string as base64/data).
-    
+
     payload = {
         "tenant_id": TENANT_ID,
         "content": RED_PIXEL_B64,
         "content_type": "image"
     }
-    
-    print("Sending image event...")
-    resp = requests.post(f"{BASE_URL}/v1/streams/{STREAM_ID}/events", json=payload)
+
+    print(f"Sending image event ({len(RED_PIXEL_BYTES)} raw bytes)...")
+    body, extra_headers = _maybe_compress(_dumps(payload))
+    resp = SESSION.post(f"{BASE_URL}/v1/streams/{STREAM_ID}/events", data=body, headers=extra_headers)
     if resp.status_code != 200:
         print(f"Failed to ingest: {resp.text}")
         return
-    
-    print("Ingest success. Waiting for consolidation (Worker cycle)...")
-    time.sleep(5) # Wait for worker to pick it up (consolidation interval is usually short)
+
+    print("Ingest success. Polling for consolidation (Worker cycle)...")
 
     # 3. Retrieve - Search for "red"
     # The Vision model should describe it as a red color or pixel.
-    
-    search_payload = {
-        "query": "red color"
-    }
-    
     print("Searching for 'red color'...")
-    search_resp = requests.post(f"{BASE_URL}/v1/streams/{STREAM_ID}/retrieve", json=search_payload, headers={"x-tenant-id": TENANT_ID})
-    
-    if search_resp.status_code == 200:
-        results = search_resp.json().get("results", [])
+    search_resp, results = poll_results(SESSION, f"{BASE_URL}/v1/streams/{STREAM_ID}/retrieve", "red color", headers={"x-tenant-id": TENANT_ID})
+
+    if search_resp is not None and search_resp.status_code == 200:
         print(f"Found {len(results)} results.")
         for r, score in results:
             print(f" - [{score:.2f}] {r['content']}")